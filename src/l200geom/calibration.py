@@ -32,7 +32,7 @@ def place_calibration_system(b: core.InstrumentationData) -> None:
         _place_source(
             b,
             source_cfg.get("name", ""),
-            np.array(source_cfg.position_in_mm[0:2]),
+            tuple(source_cfg.position_in_mm[0:2]),
             source_cfg.position_in_mm[2],
             source_type=source_spec["type"],
             cu_absorber=(cu_absorber_config if source_spec["has_cu"] else None),
@@ -42,64 +42,76 @@ def place_calibration_system(b: core.InstrumentationData) -> None:
     # place calibration tubes.
     if "calibration" not in b.special_metadata or len(b.special_metadata.calibration) == 0:
         return
-
+    calib_items = list(b.special_metadata.calibration.items())
+
+    # compute the positions of all calibration tubes at once.
+    calib_tube_count = len(calib_items)
+    calib_tube_angle = np.empty(calib_tube_count)
+    calib_tube_radius = np.empty(calib_tube_count)
+    calib_tube_lengths = np.empty(calib_tube_count)
+    for i, tube in calib_items:
+        idx = int(i) - 1
+        calib_tube_angle[idx] = tube.angle_in_deg
+        calib_tube_radius[idx] = tube.radius_in_mm
+        calib_tube_lengths[idx] = tube.length_in_mm
+    calib_tube_x, calib_tube_y = _polar_to_xy(calib_tube_angle, calib_tube_radius)
+    # the tubes hang down from the top plate, convert their lengths to the z positions of their centers.
+    calib_tube_z = b.top_plate_z_pos - calib_tube_lengths / 2
+
+    # note: the shroud volumes are also cached on the registry, this only avoids the repeated lookups.
     calib_tubes = {}
-    calib_tube_length = []
-    calib_tube_xy = np.empty((2, len(b.special_metadata.calibration)))
-    for i, tube in b.special_metadata.calibration.items():
+    for i, tube in calib_items:
         idx = int(i) - 1
-        if tube.length_in_mm not in calib_tubes:
-            calib_tubes[tube.length_in_mm] = hpge_strings._get_nylon_mini_shroud(
-                tube.tube_radius_in_mm, tube.length_in_mm, True, b.materials, b.registry
+        tube_radius, tube_length = tube.tube_radius_in_mm, tube.length_in_mm
+        tube_key = (tube_radius, tube_length)
+        shroud_lv = calib_tubes.get(tube_key)
+        if shroud_lv is None:
+            shroud_lv = hpge_strings._get_nylon_mini_shroud(
+                tube_radius, tube_length, True, b.materials, b.registry
             )
-            calib_tube_length.append(tube.length_in_mm)
+            calib_tubes[tube_key] = shroud_lv
 
-        phi = np.deg2rad(tube.angle_in_deg)
-        calib_tube_xy[:, idx] = np.array([tube.radius_in_mm * np.cos(phi), -tube.radius_in_mm * np.sin(phi)])
         nms_pv = geant4.PhysicalVolume(
             [0, 0, 0],
-            [*calib_tube_xy[:, idx], b.top_plate_z_pos - tube.length_in_mm / 2],
-            calib_tubes[tube.length_in_mm],
+            [calib_tube_x[idx], calib_tube_y[idx], calib_tube_z[idx]],
+            shroud_lv,
             f"calibration_tube_{i}",
             b.mother_lv,
             b.registry,
         )
         hpge_strings._add_nms_surfaces(nms_pv, b.mother_pv, b.materials, b.registry)
 
-    # check if we have one shared length of calibration tubes.
-    calib_tube_length = (
-        calib_tube_length[0] if all(length == calib_tube_length[0] for length in calib_tube_length) else None
-    )
-
     # place the actual calibration sources inside.
     if not hasattr(b.runtime_config, "sis"):
         return
     sis_cfg = b.runtime_config.sis
-    for i, _ in b.special_metadata.calibration.items():
-        if i not in sis_cfg or sis_cfg[i] is None:
-            continue
+    active_sis = [i for i, _ in calib_items if sis_cfg.get(i) is not None]
+    for i in active_sis:
+        sis = sis_cfg[i]
         idx = int(i) - 1
+        tube_xy = (calib_tube_x[idx], calib_tube_y[idx])
         # SIS reading to our coordinates. This marks the top of the torlon initialization pin in our
         # (pygeom) coordinates.
-        pin_top = _sis_to_pygeoml200(sis_cfg[i].sis_z)
+        pin_top = _sis_to_pygeoml200(sis.sis_z)
 
-        if len(sis_cfg[i].sources) != 4:
+        sources = sis.sources
+        if len(sources) != 4:
             msg = f"Invalid number of sources in config of SIS{i}"
             raise ValueError(msg)
 
         # z offsets from top of pin to bottom of source.
         delta_z = (-271, -171, -71, 42 + source_inside_holder)
         # always place the Ta absorber, irrespective if it holds a source.
-        _place_ta_absorber(b, f"_sis{i}", calib_tube_xy[:, idx], pin_top + delta_z[3] - source_inside_holder)
+        _place_ta_absorber(b, f"_sis{i}", tube_xy, pin_top + delta_z[3] - source_inside_holder)
 
-        for si in range(4):
-            if sis_cfg[i].sources[si] is None:
+        for si, source in enumerate(sources):
+            if source is None:
                 continue
-            source_spec = _parse_source_spec(sis_cfg[i].sources[si])
+            source_spec = _parse_source_spec(source)
             _place_source(
                 b,
                 f"_sis{i}_source{si}",
-                calib_tube_xy[:, idx],
+                tube_xy,
                 pin_top + delta_z[si] - source_inside_holder,
                 source_type=source_spec["type"],
                 cu_absorber=(cu_absorber_config if source_spec["has_cu"] else None),
@@ -119,6 +131,10 @@ ABSORBER_HEIGHT = 37.5  # mm
 # overlap of steel container with Ta absorber/source holder:
 source_outside_holder = 10.6  # mm
 source_inside_holder = source_height - source_outside_holder
+# z offsets of the steel container center (relative to the holder top) and of the source material center
+# (relative to the steel container center):
+source_outer_center_z = source_height / 2 - source_inside_holder
+source_inner_center_z = source_height / 2 - source_height_inner / 2 - source_top_inner
 
 
 def _place_source(
@@ -143,59 +159,58 @@ def _place_source(
         Do not encapsulate the source. only use if you know what you do; this does not correspond to any
         physical source geometry used in LEGEND.
     """
+    reg = b.registry
+    solids, lvs = reg.solidDict, reg.logicalVolumeDict
+
     z0 = b.top_plate_z_pos - delta_z
 
-    source_z = z0 + source_height / 2 - source_inside_holder
+    source_z = z0 + source_outer_center_z
     # outer = steel container.
     if not bare:
-        if "source_outer" not in b.registry.solidDict:
-            geant4.solid.Tubs(
-                "source_outer", 0, source_radius_outer, source_height, 0, 2 * math.pi, b.registry
-            )
-        if f"source_outer{suffix}" not in b.registry.logicalVolumeDict:
-            geant4.LogicalVolume(
-                b.registry.solidDict["source_outer"],
+        if "source_outer" not in solids:
+            geant4.solid.Tubs("source_outer", 0, source_radius_outer, source_height, 0, 2 * math.pi, reg)
+        source_outer_name = f"source_outer{suffix}"
+        source_outer = lvs.get(source_outer_name)
+        if source_outer is None:
+            source_outer = geant4.LogicalVolume(
+                solids["source_outer"],
                 b.materials.metal_steel,
-                f"source_outer{suffix}",
-                b.registry,
+                source_outer_name,
+                reg,
             )
-        source_outer = b.registry.logicalVolumeDict[f"source_outer{suffix}"]
         geant4.PhysicalVolume(
             [0, 0, 0],
             [*xy, source_z],
             source_outer,
-            f"source_outer{suffix}",
+            source_outer_name,
             b.mother_lv,
-            b.registry,
+            reg,
         )
 
     # inner = contains actual source material.
-    if "source_inner" not in b.registry.solidDict:
-        geant4.solid.Tubs(
-            "source_inner", 0, source_radius_inner, source_height_inner, 0, 2 * math.pi, b.registry
-        )
+    if "source_inner" not in solids:
+        geant4.solid.Tubs("source_inner", 0, source_radius_inner, source_height_inner, 0, 2 * math.pi, reg)
 
-    if f"source_inner_{source_type}" not in b.registry.logicalVolumeDict:
+    source_inner_name = f"source_inner_{source_type}"
+    source_inner = lvs.get(source_inner_name)
+    if source_inner is None:
         if source_type == "Th228":
             source_material = b.materials.metal_caps_gold  # for Th source
         elif source_type == "Ra":
-            source_material = geant4.MaterialPredefined("G4_SILICON_DIOXIDE")  # for Ra source
+            source_material = b.materials.silicon_dioxide  # for Ra source
         else:
             msg = f"unknown source type {source_type}"
             raise ValueError(msg)
 
-        source_inner = geant4.LogicalVolume(
-            b.registry.solidDict["source_inner"], source_material, f"source_inner_{source_type}", b.registry
-        )
+        source_inner = geant4.LogicalVolume(solids["source_inner"], source_material, source_inner_name, reg)
         source_inner.pygeom_color_rgba = (1, 1, 0, 1)
-    source_inner_z = source_height / 2 - source_height_inner / 2 - source_top_inner
     geant4.PhysicalVolume(
         [0, 0, 0],
-        [0, 0, source_inner_z] if not bare else [*xy, source_z + source_inner_z],
-        b.registry.logicalVolumeDict[f"source_inner_{source_type}"],
+        [0, 0, source_inner_center_z] if not bare else [*xy, source_z + source_inner_center_z],
+        source_inner,
         f"source_inner{suffix}",
         source_outer if not bare else b.mother_lv,
-        b.registry,
+        reg,
     )
 
     # copper absorber cap, if requested.
@@ -210,7 +225,7 @@ def _place_source(
             cu_absorber_cu,
             f"cu_absorber{suffix}",
             b.mother_lv,
-            b.registry,
+            reg,
         )
         if cu_absorber_lar is not None:
             geant4.PhysicalVolume(
@@ -219,18 +234,17 @@ def _place_source(
                 cu_absorber_lar,
                 f"cu_absorber_lar_inactive{suffix}",
                 b.mother_lv,
-                b.registry,
+                reg,
             )
 
 
 def _get_cu_cap(
     b: core.InstrumentationData, dimens: AttrsDict
 ) -> tuple[geant4.LogicalVolume, geant4.LogicalVolume | None]:
-    if "cu_absorber" in b.registry.logicalVolumeDict:
-        return (
-            b.registry.logicalVolumeDict["cu_absorber"],
-            b.registry.logicalVolumeDict.get("cu_absorber_lar_inactive", None),
-        )
+    lvs = b.registry.logicalVolumeDict
+    cu_absorber = lvs.get("cu_absorber")
+    if cu_absorber is not None:
+        return cu_absorber, lvs.get("cu_absorber_lar_inactive")
 
     if (
         dimens.inner_radius >= dimens.outer_radius
@@ -300,29 +314,37 @@ def _place_ta_absorber(
         [0, 0, 0], [*xy, z0], ta_absorber_lv, f"ta_absorber{suffix}", b.mother_lv, b.registry
     )
 
-    if "peek_holder" not in b.registry.logicalVolumeDict:
-        peek_outside = geant4.solid.Box("peek_outside", 33.1, 9, 25, b.registry)
-        peek_inside = geant4.solid.Box("peek_inside", 14, 9, 15, b.registry)  # Drawing from S. Schönert
-        peek_holder = geant4.solid.Subtraction(
-            "peek_holder", peek_outside, peek_inside, [[0, 0, 0], [0, 0, -10 / 2]], b.registry
-        )
-        peek_holder = geant4.LogicalVolume(peek_holder, b.materials.peek, "peek_holder", b.registry)
-        peek_holder.pygeom_color_rgba = (0.8, 1, 0, 1)
-
+    peek_holder_lv = _get_peek_holder(b)
     peek_holder_z = z0 + ABSORBER_HEIGHT / 2 + 25 / 2
     geant4.PhysicalVolume(
         [0, 0, 0],
         [*xy, peek_holder_z],
-        b.registry.logicalVolumeDict["peek_holder"],
+        peek_holder_lv,
         f"peek_holder{suffix}",
         b.mother_lv,
         b.registry,
     )
 
 
-def _get_ta_absorber(b: core.InstrumentationData):
-    if "ta_absorber" in b.registry.logicalVolumeDict:
-        return b.registry.logicalVolumeDict["ta_absorber"]
+def _get_peek_holder(b: core.InstrumentationData) -> geant4.LogicalVolume:
+    peek_holder_lv = b.registry.logicalVolumeDict.get("peek_holder")
+    if peek_holder_lv is not None:
+        return peek_holder_lv
+
+    peek_outside = geant4.solid.Box("peek_outside", 33.1, 9, 25, b.registry)
+    peek_inside = geant4.solid.Box("peek_inside", 14, 9, 15, b.registry)  # Drawing from S. Schönert
+    peek_holder = geant4.solid.Subtraction(
+        "peek_holder", peek_outside, peek_inside, [[0, 0, 0], [0, 0, -10 / 2]], b.registry
+    )
+    peek_holder = geant4.LogicalVolume(peek_holder, b.materials.peek, "peek_holder", b.registry)
+    peek_holder.pygeom_color_rgba = (0.8, 1, 0, 1)
+    return peek_holder
+
+
+def _get_ta_absorber(b: core.InstrumentationData) -> geant4.LogicalVolume:
+    ta_absorber_lv = b.registry.logicalVolumeDict.get("ta_absorber")
+    if ta_absorber_lv is not None:
+        return ta_absorber_lv
 
     ta_absorber_outer = geant4.solid.Tubs(
         "ta_absorber_outer",
@@ -352,13 +374,28 @@ def _get_ta_absorber(b: core.InstrumentationData):
     return geant4.LogicalVolume(ta_absorber, b.materials.metal_tantalum, "ta_absorber", b.registry)
 
 
+def _polar_to_xy(angle_in_deg: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """Convert polar coordinates (with clockwise angles) to an array of shape ``(2, N)`` of x/y positions."""
+    phi = np.deg2rad(angle_in_deg)
+    xy = np.empty((2, *phi.shape))
+    np.cos(phi, out=xy[0])
+    np.sin(phi, out=xy[1])
+    xy[0] *= radius
+    xy[1] *= -radius
+    return xy
+
+
+# SIS reading of the top plate top.
+_SIS_TOP_PLATE = (
+    5315  # mm - Ta absorber on the LAr surface
+    + 82.5  # mm - absorber height, from Pin-Jung
+    + (7333 - 5207)  # mm - funnel to LAr surface (meterdrive readings from Matt's slides)
+    + 90  # mm - funnel height from Matt's slides; _not_ including the Cu top plate thickness.
+)
+
+
 def _sis_to_pygeoml200(sis_coord: float) -> float:
-    sis_ta_on_lar = 5315  # mm
-    h_absorber = 82.5  # mm - from Pin-Jung
-    h_funnel_to_lar_surface = 7333 - 5207  # mm (meterdrive readings from Matt's slides)
-    h_funnel = 90  # mm - from Matt's slides; _not_ including the Cu top plate thickness.
-    sis_top_plate = sis_ta_on_lar + h_absorber + h_funnel_to_lar_surface + h_funnel
-    return sis_coord - sis_top_plate
+    return sis_coord - _SIS_TOP_PLATE
 
 
 def _parse_source_spec(src: str) -> dict:
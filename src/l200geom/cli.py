@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 from collections.abc import Iterable
 from pathlib import Path
@@ -80,7 +81,13 @@ def _load_user_material_code(file: str) -> None:
     spec.loader.exec_module(mod)
 
 
-def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace, dict]:
+FIBER_MODULES_DEFAULT = "segmented"
+PMT_CONFIG_DEFAULT = "LEGEND200"
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser; it only depends on constants, so it is built only once per process."""
     parser = argparse.ArgumentParser(
         prog="legend-pygeom-l200",
         description="%(prog)s command line interface",
@@ -150,19 +157,17 @@ def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace,
             additionally available: {",".join(extra_assemblies)})"""
         ),
     )
-    fiber_modules_default = "segmented"
     geom_opts.add_argument(
         "--fiber-modules",
         action="store",
         choices=("segmented", "detailed"),
-        help=f"""Select the fiber shroud model, either coarse segments or single fibers. (default: {fiber_modules_default})""",
+        help=f"""Select the fiber shroud model, either coarse segments or single fibers. (default: {FIBER_MODULES_DEFAULT})""",
     )
-    pmt_config_default = "LEGEND200"
     geom_opts.add_argument(
         "--pmt-config",
         action="store",
         choices=core.PMT_CONFIGURATIONS,
-        help=f"""Select the PMT configuration of the muon veto. (default: {pmt_config_default})""",
+        help=f"""Select the PMT configuration of the muon veto. (default: {PMT_CONFIG_DEFAULT})""",
     )
     geom_opts.add_argument(
         "--public-geom",
@@ -183,6 +188,11 @@ def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace,
         help="""File name for the output GDML geometry.""",
     )
 
+    return parser
+
+
+def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace, dict]:
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     config = {}
@@ -191,8 +201,8 @@ def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace,
 
     # also load geometry options from config file.
     _config_or_cli_arg(args, config, "assemblies", None)
-    _config_or_cli_arg(args, config, "fiber_modules", fiber_modules_default)
-    _config_or_cli_arg(args, config, "pmt_config", pmt_config_default)
+    _config_or_cli_arg(args, config, "fiber_modules", FIBER_MODULES_DEFAULT)
+    _config_or_cli_arg(args, config, "pmt_config", PMT_CONFIG_DEFAULT)
     _config_or_cli_arg(args, config, "public_geom", False)
 
     # process assembly list after loading all parameter sources.
@@ -210,7 +220,7 @@ def _parse_cli_args(argv: list[str] | None = None) -> tuple[argparse.Namespace,
     return args, config
 
 
-def _parse_assemblies(arg: str | Iterable[str] | None) -> set[str]:
+def _parse_assemblies(arg: str | Iterable[str] | None) -> frozenset[str]:
     """Parse an argument string into a set of assemblies to build the geometry for.
 
     Parameters
@@ -221,26 +231,29 @@ def _parse_assemblies(arg: str | Iterable[str] | None) -> set[str]:
         with such an operator, or none.
     """
     if arg is None or len(arg) == 0:
-        return core.DEFAULT_ASSEMBLIES
+        return frozenset(core.DEFAULT_ASSEMBLIES)
 
     parts = [a.strip() for a in arg.split(",") if a.strip() != ""] if isinstance(arg, str) else arg
 
-    with_no_op = [a[0] not in ("+", "-") for a in parts]
-    if any(with_no_op) and not all(with_no_op):
-        msg = "either all or no assemblies can be prefixed by the operators '+' or '-'"
-        raise ValueError(msg)
-
-    if not any(with_no_op):  # all have operators
-        assemblies = set(core.DEFAULT_ASSEMBLIES)  # make a copy
-        for p in parts:
-            if p[0] == "-":
-                assemblies -= {p[1:]}
-            elif p[0] == "+":
-                assemblies |= {p[1:]}
-    else:
-        assemblies = set(parts)
-
-    return assemblies
+    # apply the operators in order to a copy of the default list, and collect all parts without operator.
+    assemblies = set(core.DEFAULT_ASSEMBLIES)
+    plain = set()
+    with_op = False
+    for p in parts:
+        if p.startswith("-"):
+            assemblies.discard(p[1:])
+            with_op = True
+        elif p.startswith("+"):
+            assemblies.add(p[1:])
+            with_op = True
+        else:
+            plain.add(p)
+
+        if with_op and plain:
+            msg = "either all or no assemblies can be prefixed by the operators '+' or '-'"
+            raise ValueError(msg)
+
+    return frozenset(plain or assemblies)
 
 
 def _config_or_cli_arg(args: argparse.Namespace, config: dict, name: str, default) -> None:
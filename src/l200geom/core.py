@@ -6,19 +6,17 @@ from importlib import resources
 from typing import NamedTuple
 
 from dbetto import AttrsDict, TextDB
-from git import GitCommandError
-from legendmeta import LegendMetadata
 from pyg4ometry import geant4
 from pygeomtools.utils import load_dict_from_config
 
-from . import calibration, cryo, fibers, hpge_strings, materials, top, watertank, wlsr
+from . import cryo, materials
 from .metadata import PublicMetadataProxy
 
 log = logging.getLogger(__name__)
 
 configs = TextDB(resources.files("l200geom") / "configs" / "extra_meta")
 
-DEFAULT_ASSEMBLIES = {"wlsr", "strings", "calibration", "fibers", "top"}
+DEFAULT_ASSEMBLIES = frozenset({"wlsr", "strings", "calibration", "fibers", "top"})
 DEFINED_ASSEMBLIES = DEFAULT_ASSEMBLIES | {"watertank"}
 
 PMT_CONFIGURATIONS = {"LEGEND200", "GERDA"}
@@ -48,14 +46,15 @@ class InstrumentationData(NamedTuple):
 
 
 def construct(
-    assemblies: list[str] | set[str] = DEFAULT_ASSEMBLIES,
+    assemblies: list[str] | set[str] | frozenset[str] = DEFAULT_ASSEMBLIES,
     pmt_configuration_mv: str = "LEGEND200",
     use_detailed_fiber_model: bool = False,
     config: dict | None = None,
     public_geometry: bool = False,
 ) -> geant4.Registry:
     """Construct the LEGEND-200 geometry and return the pyg4ometry Registry containing the world volume."""
-    if set(assemblies) - set(DEFINED_ASSEMBLIES) != set():
+    assemblies = frozenset(assemblies)
+    if not assemblies <= DEFINED_ASSEMBLIES:
         msg = "invalid geometrical assembly specified"
         raise ValueError(msg)
 
@@ -65,6 +64,10 @@ def construct(
 
     lmeta = None
     if not public_geometry:
+        # note: only import the metadata package (and its git dependency) if it is really needed.
+        from git import GitCommandError
+        from legendmeta import LegendMetadata
+
         with contextlib.suppress(GitCommandError):
             lmeta = LegendMetadata()
     # require user action to construct a testdata-only geometry (i.e. to avoid accidental creation of "wrong"
@@ -94,6 +97,8 @@ def construct(
     cryostat_lv = cryo.construct_cryostat(mats.metal_steel, reg)
 
     if "watertank" in assemblies:
+        from . import watertank
+
         # TODO: Shift the global coordinate system that z=0 is a reasonable value for defining hit positions.
         tank_z_displacement = 0.0
         cryo_z_displacement = (
@@ -150,20 +155,31 @@ def construct(
         lar_lv, lar_pv, mats, reg, channelmap, special_metadata, AttrsDict(config), top_plate_z_pos
     )
 
-    # Place all instrumentation into the liquid argon
+    # Place all instrumentation into the liquid argon. The assembly modules are only imported if they are
+    # requested, as some of them pull in heavy dependencies.
     if "wlsr" in assemblies:
+        from . import wlsr
+
         # height below the lower end of the neck (even though this intended dimension is quite certainly
         # not really met in reality, P. Krause estimates ~cm uncertainty).
         wlsr.place_wlsr(instr, lar_neck_height - 1247.41, reg)
 
     if "strings" in assemblies:
+        from . import hpge_strings
+
         hw_meta = lmeta.hardware.detectors.germanium.diodes if lmeta is not None else dummy_geom.diodes
         hpge_strings.place_hpge_strings(hw_meta, instr)
     if "calibration" in assemblies:
+        from . import calibration
+
         calibration.place_calibration_system(instr)
     if "top" in assemblies:
+        from . import top
+
         top.place_top_plate(instr)
     if "fibers" in assemblies:
+        from . import fibers
+
         hw_meta = lmeta.hardware.detectors.lar.fibers if lmeta is not None else dummy_geom.fibers
         fibers.place_fiber_modules(hw_meta, instr, use_detailed_fiber_model)
 
@@ -173,16 +189,20 @@ def construct(
 
 
 def _assign_common_copper_surface(b: InstrumentationData) -> None:
-    if hasattr(b.materials, "_metal_copper") is None:
+    # if the copper material has never been created, there cannot be any copper volume.
+    if not hasattr(b.materials, "_metal_copper"):
         return
     surf = None
     cu_mat = b.materials.metal_copper
+    mother_pv, reg = b.mother_pv, b.registry
 
-    for _, pv in b.registry.physicalVolumeDict.items():
-        if pv.motherVolume != b.mother_lv or pv.logicalVolume.material != cu_mat:
+    # only direct daughters of the mother volume are relevant, so do not scan the whole registry.
+    for pv in b.mother_lv.daughterVolumes:
+        if pv.logicalVolume.material is not cu_mat:
             continue
+        # note: only create the surface lazily, to not add an unused surface to the registry.
         if surf is None:
             surf = b.materials.surfaces.to_copper
 
-        geant4.BorderSurface("bsurface_lar_cu_" + pv.name, b.mother_pv, pv, surf, b.registry)
-        geant4.BorderSurface("bsurface_cu_lar_" + pv.name, pv, b.mother_pv, surf, b.registry)
+        geant4.BorderSurface("bsurface_lar_cu_" + pv.name, mother_pv, pv, surf, reg)
+        geant4.BorderSurface("bsurface_cu_lar_" + pv.name, pv, mother_pv, surf, reg)
@@ -24,13 +24,20 @@ cryo_access_wall = 10
 cryo_access_height = 1720
 access_overlap = 200
 
+# derived dimensions of the outer cryostat solids.
+cryo_outer_radius = cryo_radius + cryo_wall
+cryo_top_full_height = 2 * cryo_top_height + 2 * cryo_wall
+cryo_bottom_full_height = 2 * cryo_bottom_height + 2 * cryo_wall
+cryo_access_outer_radius = cryo_access_radius + cryo_access_wall
+cryo_access_full_height = cryo_access_height + access_overlap
+
 
 def construct_cryostat(cryostat_material: g4.Material, reg: g4.Registry) -> g4.LogicalVolume:
     cryo_top = g4.solid.Tubs(
         "cryo_top",
         0,
-        cryo_radius + cryo_wall,
-        2 * cryo_top_height + 2 * cryo_wall,
+        cryo_outer_radius,
+        cryo_top_full_height,
         0,
         2 * pi,
         reg,
@@ -39,8 +46,8 @@ def construct_cryostat(cryostat_material: g4.Material, reg: g4.Registry) -> g4.L
     cryo_access_tub = g4.solid.Tubs(
         "cryo_access_tub",
         0,
-        cryo_access_radius + cryo_access_wall,
-        cryo_access_height + access_overlap,
+        cryo_access_outer_radius,
+        cryo_access_full_height,
         0,
         2 * pi,
         reg,
@@ -49,14 +56,14 @@ def construct_cryostat(cryostat_material: g4.Material, reg: g4.Registry) -> g4.L
     cryo_bottom = g4.solid.Tubs(
         "cryo_bottom",
         0,
-        cryo_radius + cryo_wall,
-        2 * cryo_bottom_height + 2 * cryo_wall,
+        cryo_outer_radius,
+        cryo_bottom_full_height,
         0,
         2 * pi,
         reg,
         "mm",
     )
-    cryo_tub = g4.solid.Tubs("cryo_tub", 0, cryo_radius + cryo_wall, cryo_tub_height, 0, 2 * pi, reg, "mm")
+    cryo_tub = g4.solid.Tubs("cryo_tub", 0, cryo_outer_radius, cryo_tub_height, 0, 2 * pi, reg, "mm")
 
     cryo1 = g4.solid.Union("cryo1", cryo_tub, cryo_top, [[0, 0, 0], [0, 0, cryo_tub_height / 2]], reg)
     cryo2 = g4.solid.Union("cryo2", cryo1, cryo_bottom, [[0, pi, 0], [0, 0, -cryo_tub_height / 2]], reg)
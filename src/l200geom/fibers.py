@@ -30,20 +30,23 @@ def place_fiber_modules(
     modules = {}
     ch_map = b.channelmap.map("system", unique=False).get("spms", {})
     for ch in ch_map.values():
-        mod = modules.get(ch.location.fiber)
+        # avoid repeatedly walking the nested metadata dictionaries.
+        fiber, position = ch.location.fiber, ch.location.position
+        mod = modules.get(fiber)
 
         if mod is None:
             # initialize a new module object if we don't have one yet.
+            fiber_meta = fiber_metadata[fiber]
             mod = FiberModuleData(
-                name=ch.location.fiber,
-                barrel=fiber_metadata[ch.location.fiber].type,
-                tpb_thickness=fiber_metadata[ch.location.fiber].geometry.tpb.thickness_in_nm,
+                name=fiber,
+                barrel=fiber_meta.type,
+                tpb_thickness=fiber_meta.geometry.tpb.thickness_in_nm,
             )
-            modules[ch.location.fiber] = mod
+            modules[fiber] = mod
 
-        assert getattr(mod, f"channel_{ch.location.position}_name") is None
-        setattr(mod, f"channel_{ch.location.position}_name", ch.name)
-        setattr(mod, f"channel_{ch.location.position}_rawid", ch.daq.rawid)
+        assert getattr(mod, f"channel_{position}_name") is None
+        setattr(mod, f"channel_{position}_name", ch.name)
+        setattr(mod, f"channel_{position}_rawid", ch.daq.rawid)
 
     factory = ModuleFactorySingleFibers if use_detailed_fiber_model else ModuleFactorySegment
 
@@ -94,11 +97,11 @@ def place_fiber_modules(
         barrel="inner",
     )
 
+    factories = {"outer": ob_factory, "inner": ib_factory}
     for mod in modules.values():
-        if mod.barrel == "outer":
-            ob_factory.create_module(mod, b.mother_lv, b.mother_pv)
-        if mod.barrel == "inner":
-            ib_factory.create_module(mod, b.mother_lv, b.mother_pv)
+        mod_factory = factories.get(mod.barrel)
+        if mod_factory is not None:
+            mod_factory.create_module(mod, b.mother_lv, b.mother_pv)
 
 
 def _module_name_to_num(mod_name: str) -> int:
@@ -179,6 +182,9 @@ class ModuleFactoryBase(ABC):
         self.fiber_count_per_module = fiber_count_per_module
         self.bend_radius_mm = bend_radius_mm
         self.number_of_modules = number_of_modules
+        # angular width of a whole module, and of a single fiber in it.
+        self.fiber_segment = 2 * math.pi / number_of_modules
+        self.fiber_subsegment = self.fiber_segment / fiber_count_per_module
         self.zero_angle_module = zero_angle_module
         self.z_displacement = z_displacement_mm
         self.barrel = barrel
@@ -193,7 +199,6 @@ class ModuleFactoryBase(ABC):
             return
 
         sipm_dim = self.FIBER_DIM + self.SIPM_GAP_SIDE  # GAP_SIDE to fit round->square
-        fiber_segment = 2 * math.pi / self.number_of_modules
 
         sipm = g4.solid.Tubs(
             v_name,
@@ -201,7 +206,7 @@ class ModuleFactoryBase(ABC):
             self.radius + sipm_dim / 2,
             self.SIPM_HEIGHT,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -213,7 +218,7 @@ class ModuleFactoryBase(ABC):
             self.radius + sipm_dim / 2 + self.SIPM_OUTER_EXTRA,
             self.SIPM_HEIGHT + self.SIPM_OUTER_EXTRA + self.SIPM_OVERLAP,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -223,7 +228,7 @@ class ModuleFactoryBase(ABC):
             self.radius + sipm_dim / 2,
             self.SIPM_HEIGHT + 2 * self.SIPM_GAP + self.SIPM_OVERLAP,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -272,7 +277,7 @@ class ModuleFactoryBase(ABC):
         # )
 
     def start_angle(self, module_num: int) -> float:
-        return 2 * math.pi / self.number_of_modules * (module_num - self.zero_angle_module - 0.5)
+        return self.fiber_segment * (module_num - self.zero_angle_module - 0.5)
 
     @abstractmethod
     def create_module(
@@ -286,7 +291,6 @@ class ModuleFactoryBase(ABC):
     def _create_sipm(
         self,
         module_num: int,
-        fibers: list[g4.PhysicalVolume],
         is_top: bool,
         mother_lv: g4.LogicalVolume,
         mother_pv: g4.PhysicalVolume,
@@ -626,14 +630,36 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
         if self.bend_radius_mm is not None:
             self._cached_sipm_volumes_bend()
             coating_lv_bend = self._cached_tpb_coating_volume(mod.tpb_thickness, bend=True)
+        # only look up the coating volume for each of the (few) different fiber lengths once.
+        delta_lengths = self.ALLOWED_DELTA_LENGTHS if self.bend_radius_mm is not None else (0,)
+        coating_lvs = {
+            delta_length: self._cached_tpb_coating_volume(
+                mod.tpb_thickness, bend=False, delta_length=delta_length
+            )
+            for delta_length in delta_lengths
+        }
 
         start_angle = self.start_angle(module_num)
 
         z_displacement_straight = self.z_displacement - self.fiber_length / 2
 
+        # compute the polar angles of all fibers of this module at once.
+        fiber_angles = start_angle + self.fiber_subsegment * (np.arange(self.fiber_count_per_module) + 0.5)
+        fiber_cos = np.cos(fiber_angles).tolist()
+        fiber_sin = np.sin(fiber_angles).tolist()
+
+        if self.bend_radius_mm is not None:
+            # radii and z positions of the bent fiber parts, equal for all fibers in this module.
+            bend_placement_r = self.radius - self.bend_radius_mm
+            sipm_placement_r = bend_placement_r - self.SIPM_GAP - self.SIPM_HEIGHT / 2
+            sipm_placement_outer_r = (
+                sipm_placement_r - self.SIPM_OUTER_EXTRA / 2 + self.SIPM_OVERLAP / 2 - self.SIPM_GAP
+            )
+            z_bottom_straight = z_displacement_straight - self.fiber_length / 2
+
         fibers = []
         sipm_transforms = []  # transforms for SiPMs in the MultiUnion structure.
-        for n in range(self.fiber_count_per_module):
+        for n, (th, cos_th, sin_th) in enumerate(zip(fiber_angles.tolist(), fiber_cos, fiber_sin)):
             delta_length = 0
             if self.bend_radius_mm is not None:
                 # for bent detailed fibers, the fibers would overlap a lot near the bottom SiPMs. To avoid
@@ -643,13 +669,10 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
                 # if a photon arrives from the 'right' direction...
                 delta_length = self.ALLOWED_DELTA_LENGTHS[n % len(self.ALLOWED_DELTA_LENGTHS)]
 
-            coating_lv = self._cached_tpb_coating_volume(
-                mod.tpb_thickness, bend=False, delta_length=delta_length
-            )
+            coating_lv = coating_lvs[delta_length]
 
-            th = start_angle + 2 * math.pi / self.number_of_modules / self.fiber_count_per_module * (n + 0.5)
-            x = self.radius * math.cos(th)
-            y = self.radius * math.sin(th)
+            x = self.radius * cos_th
+            y = self.radius * sin_th
             fibers.append(
                 g4.PhysicalVolume(
                     [0, 0, -th],
@@ -661,13 +684,13 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
                 )
             )
             if self.bend_radius_mm is not None:
-                x2 = (self.radius - self.bend_radius_mm) * math.cos(th)
-                y2 = (self.radius - self.bend_radius_mm) * math.sin(th)
+                x2 = bend_placement_r * cos_th
+                y2 = bend_placement_r * sin_th
                 fibers.append(
                     g4.PhysicalVolume(
                         # this is an extrinsic rotation of pi/2 around X and -th around Z; expressed in intrinsic euler angles.
                         [math.pi / 2, th, 0],
-                        [x2, y2, z_displacement_straight - self.fiber_length / 2 - delta_length],
+                        [x2, y2, z_bottom_straight - delta_length],
                         coating_lv_bend,
                         f"fiber_{self.barrel}_tpb_{mod.name}_bend_{n}",
                         mother_lv,
@@ -676,17 +699,13 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
                 )
 
                 # add per-fiber SiPMs (I do not know any other way...)
-                sipm_placement_r = self.radius - self.bend_radius_mm - self.SIPM_GAP - self.SIPM_HEIGHT / 2
-                x2 = sipm_placement_r * math.cos(th)
-                y2 = sipm_placement_r * math.sin(th)
-                z = z_displacement_straight - self.fiber_length / 2 - delta_length - self.bend_radius_mm
+                x2 = sipm_placement_r * cos_th
+                y2 = sipm_placement_r * sin_th
+                z = z_bottom_straight - delta_length - self.bend_radius_mm
                 sipm_transforms.append([[0, 0, th], [x2, y2, z]])
 
-                sipm_placement_outer_r = (
-                    sipm_placement_r - self.SIPM_OUTER_EXTRA / 2 + self.SIPM_OVERLAP / 2 - self.SIPM_GAP
-                )
-                x2 = sipm_placement_outer_r * math.cos(th)
-                y2 = sipm_placement_outer_r * math.sin(th)
+                x2 = sipm_placement_outer_r * cos_th
+                y2 = sipm_placement_outer_r * sin_th
                 g4.PhysicalVolume(
                     [0, 0, -th],
                     [x2, y2, z],
@@ -701,7 +720,6 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
         # create SiPMs and attach to fibers
         self._create_sipm(
             module_num,
-            fibers,
             True,
             mother_lv,
             mother_pv,
@@ -712,7 +730,6 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
         if self.bend_radius_mm is None:
             self._create_sipm(
                 module_num,
-                fibers,
                 False,
                 mother_lv,
                 mother_pv,
@@ -747,6 +764,10 @@ class ModuleFactorySingleFibers(ModuleFactoryBase):
 
 
 class ModuleFactorySegment(ModuleFactoryBase):
+    # number of samples along each arc of the bend polycone. Fewer points make tracking through the
+    # polycone cheaper, but approximate the circular bend less accurately.
+    BEND_POLYCONE_POINTS = 100
+
     def _get_bend_polycone(
         self, inner_r: float, outer_r: float
     ) -> tuple[np.typing.ArrayLike, np.typing.ArrayLike]:
@@ -757,15 +778,19 @@ class ModuleFactorySegment(ModuleFactoryBase):
         bend_r_outer = self.bend_radius_mm + delta_r_mm
         bend_r_inner = self.bend_radius_mm - delta_r_mm
 
-        angles = np.linspace(0, np.pi / 2, 100)
-        z1 = bend_r_outer * np.sin(angles)
-        r1 = bend_r_outer * np.cos(angles)
-        z2 = bend_r_inner * np.sin(angles)
-        r2 = bend_r_inner * np.cos(angles)
+        angles = np.linspace(0, np.pi / 2, self.BEND_POLYCONE_POINTS)
+        # the inner and outer arc share the same angles, so only evaluate the trig functions once.
+        sin_a, cos_a = np.sin(angles), np.cos(angles)
 
-        z = self.bend_radius_mm - np.concatenate((z1, np.flip(z2)))
+        # the outer arc is traversed forward, the inner arc backwards.
+        n = angles.size
+        z = np.empty(2 * n)
+        z[:n] = self.bend_radius_mm - bend_r_outer * sin_a
+        z[n:] = self.bend_radius_mm - bend_r_inner * sin_a[::-1]
         # offset by the radius at the inner end of the bend.
-        r = (outer_r - bend_r_outer) + np.concatenate((r1, np.flip(r2)))
+        r = np.empty(2 * n)
+        r[:n] = (outer_r - bend_r_outer) + bend_r_outer * cos_a
+        r[n:] = (outer_r - bend_r_outer) + bend_r_inner * cos_a[::-1]
 
         return z, r
 
@@ -777,7 +802,6 @@ class ModuleFactorySegment(ModuleFactoryBase):
             return
 
         sipm_dim = self.FIBER_DIM + self.SIPM_GAP_SIDE  # GAP_SIDE to fit round->square
-        fiber_segment = 2 * math.pi / self.number_of_modules
         # radius of the inner circle at the bottom, already including the small gap between fibers and SiPM.
         inner_radius = self.radius - self.bend_radius_mm - self.SIPM_GAP
 
@@ -787,7 +811,7 @@ class ModuleFactorySegment(ModuleFactoryBase):
             inner_radius,
             sipm_dim,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -799,7 +823,7 @@ class ModuleFactorySegment(ModuleFactoryBase):
             inner_radius + self.SIPM_OVERLAP,
             sipm_dim + 2 * self.SIPM_OUTER_EXTRA,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -809,7 +833,7 @@ class ModuleFactorySegment(ModuleFactoryBase):
             inner_radius + 2 * self.SIPM_GAP + self.SIPM_OVERLAP,
             sipm_dim,
             0,
-            fiber_segment,
+            self.fiber_segment,
             self.registry,
             "mm",
         )
@@ -836,7 +860,7 @@ class ModuleFactorySegment(ModuleFactoryBase):
             return
 
         # create solids
-        angle = 2 * np.pi / self.number_of_modules
+        angle = self.fiber_segment
         dim_cl2 = self.FIBER_DIM
         fiber_cl2 = g4.solid.Tubs(
             f"fiber_cl2{v_suffix}",
@@ -961,13 +985,13 @@ class ModuleFactorySegment(ModuleFactoryBase):
                 self.radius + coating_dim / 2,
                 self.fiber_length,
                 0,
-                2 * math.pi / self.number_of_modules,
+                self.fiber_segment,
                 self.registry,
                 "mm",
             )
             inner_lv = self.fiber_cl2_lv
         else:
-            angle = 2 * np.pi / self.number_of_modules
+            angle = self.fiber_segment
             z, r = self._get_bend_polycone(self.radius - coating_dim / 2, self.radius + coating_dim / 2)
             coating = g4.solid.GenericPolycone(v_name, 0, angle, r, z, self.registry, "mm")
             inner_lv = self.fiber_cl2_bend_lv
@@ -1037,7 +1061,6 @@ class ModuleFactorySegment(ModuleFactoryBase):
         # create SiPMs and attach to fibers
         self._create_sipm(
             module_num,
-            fibers,
             True,
             mother_lv,
             mother_pv,
@@ -1048,7 +1071,6 @@ class ModuleFactorySegment(ModuleFactoryBase):
         if self.bend_radius_mm is None:
             self._create_sipm(
                 module_num,
-                fibers,
                 False,
                 mother_lv,
                 mother_pv,
@@ -191,6 +191,11 @@ class OpticalMaterialRegistry:
 
         return _metal_caps_gold
 
+    @cached_property
+    def silicon_dioxide(self) -> g4.Material:
+        """Silicon dioxide (NIST material) for the Ra calibration source."""
+        return g4.MaterialPredefined("G4_SILICON_DIOXIDE")
+
     @cached_property
     def peek(self) -> g4.Material:
         """PEEK for the SIS absorber holder."""
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 
+import pytest
+
 public_geom = os.getenv("LEGEND_METADATA", "") == ""
 
 
@@ -49,3 +51,41 @@ def test_construct_with_sis(tmp_path):
     for i in range(3):
         assert f"source_inner_sis1_source{i}" in registry.physicalVolumeDict
         assert f"source_inner_sis2_source{i}" in registry.physicalVolumeDict
+
+
+def test_parse_source_spec():
+    from l200geom import calibration
+
+    expected = {
+        "Th228": {"type": "Th228", "has_cu": False, "bare": False},
+        "Ra": {"type": "Ra", "has_cu": False, "bare": False},
+        "Th228+Cu": {"type": "Th228", "has_cu": True, "bare": False},
+        "Ra+Cu": {"type": "Ra", "has_cu": True, "bare": False},
+        "Th228+_bare": {"type": "Th228", "has_cu": False, "bare": True},
+        "Ra+_bare+Cu": {"type": "Ra", "has_cu": True, "bare": True},
+    }
+    for spec, parsed in expected.items():
+        assert calibration._parse_source_spec(spec) == parsed
+
+    for invalid in ("Co60", "Th228+Pb", "Th228+"):
+        with pytest.raises(ValueError):
+            calibration._parse_source_spec(invalid)
+
+
+def test_calibration_tube_radii():
+    import copy
+
+    from l200geom import core
+
+    # two calibration tubes with the same length, but different radii.
+    special_metadata = copy.deepcopy(core.configs.on("20230311T235840Z"))
+    assert special_metadata["calibration"]["2"]["length_in_mm"] == 1400
+    special_metadata["calibration"]["2"]["tube_radius_in_mm"] = 25
+    cfg = {"special_metadata": special_metadata}
+
+    registry = core.construct(assemblies=["calibration"], config=cfg, public_geometry=public_geom)
+    assert "minishroud_19x1400" in registry.logicalVolumeDict
+    assert "minishroud_25x1400" in registry.logicalVolumeDict
+    tubes = registry.physicalVolumeDict
+    assert tubes["calibration_tube_1"].logicalVolume.name == "minishroud_19x1400"
+    assert tubes["calibration_tube_2"].logicalVolume.name == "minishroud_25x1400"
@@ -39,5 +39,10 @@ def test_assemblies():
     assert _parse_assemblies("+watertank,-fibers") == (DEFAULT_ASSEMBLIES | {"watertank"}) - {"fibers"}
     assert _parse_assemblies(["+watertank", "-fibers"]) == (DEFAULT_ASSEMBLIES | {"watertank"}) - {"fibers"}
 
+    # the result type should not depend on the input.
+    assert isinstance(_parse_assemblies(None), frozenset)
+    assert isinstance(_parse_assemblies("watertank"), frozenset)
+    assert isinstance(_parse_assemblies("+watertank"), frozenset)
+
     with pytest.raises(ValueError, match="all or no assemblies can be prefixed"):
         _parse_assemblies("+watertank,fibers")
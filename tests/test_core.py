@@ -163,3 +163,16 @@ def test_special(change_dir, tmp_path):
     assert "counterweight_wrapped" in reg.solidDict
     assert "hpge_support_copper_string_support_structure_short" in reg.logicalVolumeDict
     assert "hpge_support_copper_string_support_structure" not in reg.logicalVolumeDict
+
+
+def test_copper_surfaces():
+    from l200geom import core
+
+    # without any copper volume, no copper surfaces should be created.
+    reg = core.construct(assemblies=["fibers"], public_geometry=public_geom)
+    assert not any(name.startswith("bsurface_lar_cu_") for name in reg.surfaceDict)
+
+    # the copper top plate is placed directly in the argon, and needs surfaces in both directions.
+    reg = core.construct(assemblies=["fibers", "top"], public_geometry=public_geom)
+    assert "bsurface_lar_cu_top_plate" in reg.surfaceDict
+    assert "bsurface_cu_lar_top_plate" in reg.surfaceDict